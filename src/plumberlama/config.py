@@ -59,6 +59,19 @@ class Config:
         self.db_user = db_user
         self.db_password = db_password
 
+    def replace(self, **changes) -> "Config":
+        """Return a new config with the given attributes replaced.
+
+        Goes through __init__, so the replaced values are validated. Derived
+        defaults keep their stored value; pass e.g. mkdocs_site_name="" to
+        recompute it from the new survey_id.
+
+        Raises:
+            TypeError: If a key is not a config attribute
+            AssertionError: If the resulting config fails validation
+        """
+        return Config(**{**vars(self), **changes})
+
     def get_db_connection_uri(self) -> str:
         """Get PostgreSQL connection URI from config.
 
@@ -2,7 +2,7 @@ import os
 from typing import Optional
 
 import polars as pl
-from sqlalchemy import Column, MetaData, Table, create_engine
+from sqlalchemy import Column, Connection, MetaData, Table, create_engine
 
 from plumberlama.config import Config
 from plumberlama.logging_config import get_logger
@@ -29,11 +29,14 @@ def save_to_database(
     table_prefix: str = "survey",
     append: bool = True,
     config: Optional[Config] = None,
+    connection: Optional[Connection] = None,
 ):
-    """Save survey dataframes to PostgreSQL database with native types."""
+    """Save survey dataframes to PostgreSQL database with native types.
+
+    If ``connection`` is given, writes run on it and the caller owns the
+    transaction; otherwise a new engine is created from ``config``.
+    """
 
-    connection_uri = config.get_db_connection_uri()
-    engine = create_engine(connection_uri)
     db_metadata = MetaData()
 
     # Define table names
@@ -48,7 +51,7 @@ def save_to_database(
         metadata_df, metadata_table_name, db_metadata
     )
 
-    with engine.begin() as conn:
+    def _write(conn: Connection) -> None:
         # Create tables if they don't exist (or fail if append=False and they exist)
         if not append:
             # Create tables, fail if they already exist
@@ -60,6 +63,13 @@ def save_to_database(
         metadata_records = metadata_df.to_dicts()
         conn.execute(metadata_table.insert(), metadata_records)
 
+    if connection is not None:
+        _write(connection)
+    else:
+        engine = create_engine(config.get_db_connection_uri())
+        with engine.begin() as conn:
+            _write(conn)
+
     # Log confirmation
     db_host = os.getenv("DB_HOST", "localhost")
     db_port = os.getenv("DB_PORT", "5432")
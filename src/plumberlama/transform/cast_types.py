@@ -1,6 +1,10 @@
+import re
+
 import pandera.polars as pa
 import polars as pl
 
+ENUM_CATEGORIES_RE = re.compile(r"Enum\(categories=\[(.*?)\]\)")
+
 
 def cast_results_to_schema(
     results_df: pl.DataFrame, schema: pa.DataFrameSchema
@@ -58,9 +62,7 @@ def cast_results_to_schema(
             )
         elif "Enum" in dtype_str:
             # Cast to Enum type - extract categories from dtype string
-            import re
-
-            match = re.search(r"Enum\(categories=\[(.*?)\]\)", dtype_str)
+            match = ENUM_CATEGORIES_RE.search(dtype_str)
             if match:
                 categories_str = match.group(1)
                 # Parse the categories list
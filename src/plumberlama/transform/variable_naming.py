@@ -2,6 +2,8 @@ import re
 
 import polars as pl
 
+VALID_SUFFIX_RE = re.compile(r"^[a-z]+$")
+
 
 def _sanitize_suffix(suffix: str) -> str:
     """Remove German umlauts and other non-ASCII characters from variable suffix."""
@@ -60,7 +62,7 @@ def _generate_llm_name(
         suffix = _sanitize_suffix(suffix)
 
         # Validate: only lowercase ASCII letters allowed
-        if not re.match(r"^[a-z]+$", suffix):
+        if not VALID_SUFFIX_RE.match(suffix):
             if attempt < max_retries - 1:
                 continue
             else:
@@ -142,10 +144,6 @@ def rename_vars_with_labels(metadata_df, generator, lm):
     Returns:
         DataFrame with renamed variables and original_id column added
     """
-    vars_per_question = metadata_df.group_by("question_id").agg(
-        pl.count("id").alias("var_count")
-    )
-
     rename_mapping = {}
     all_names = set()
 
@@ -156,12 +154,8 @@ def rename_vars_with_labels(metadata_df, generator, lm):
         question_id = var["question_id"]
         variables_by_question.setdefault(question_id, []).append(var)
 
-    for question_id, question_vars in variables_by_question.items():
-        var_count = vars_per_question.filter(pl.col("question_id") == question_id)[
-            "var_count"
-        ][0]
-
-        if var_count == 1:
+    for question_vars in variables_by_question.values():
+        if len(question_vars) == 1:
             var = question_vars[0]
             new_var_id = _apply_other_suffix(
                 f"Q{var['question_position']}",
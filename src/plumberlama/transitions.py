@@ -29,7 +29,6 @@ from plumberlama.states import (
 )
 from plumberlama.transform.cast_types import cast_results_to_schema
 from plumberlama.transform.decode import decode_single_choice
-from plumberlama.transform.llm import load_llm, make_generator
 from plumberlama.transform.rename_results_columns import rename_results_columns
 from plumberlama.transform.variable_naming import rename_vars_with_labels
 from plumberlama.validation_schemas import make_results_schema
@@ -116,6 +115,9 @@ def process_poll_metadata(
 ) -> ProcessedMetadataState:
     """Process metadata by renaming variables with LLM-generated names."""
     logger.info("Processing metadata (LLM variable naming)...")
+    # Imported here: DSPy/litellm are slow to import and only needed for this step
+    from plumberlama.transform.llm import load_llm, make_generator
+
     # Generate variable names with LLM
     llm = load_llm(config.llm_model, config.llm_key, config.llm_base_url)
 
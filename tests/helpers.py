@@ -0,0 +1,17 @@
+"""Helpers shared by unit and integration tests."""
+
+import polars as pl
+
+
+def with_first_value(df, column, value):
+    """Return a copy of df with the value of column in the first row replaced."""
+    return (
+        df.with_row_index()
+        .with_columns(
+            pl.when(pl.col("index") == 0)
+            .then(pl.lit(value, dtype=df.schema[column]))
+            .otherwise(pl.col(column))
+            .alias(column)
+        )
+        .drop("index")
+    )
@@ -0,0 +1,77 @@
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+
+from plumberlama.io.database import save_to_database
+from plumberlama.transitions import generate_doc
+
+SHM_DIR = "/dev/shm"
+
+
+@pytest.fixture(scope="session")
+def site_build_root(tmp_path_factory):
+    """Root directory for built MkDocs sites.
+
+    Placed on tmpfs (/dev/shm) when it is writable, otherwise in pytest's tmp dir.
+    """
+    if os.path.isdir(SHM_DIR) and os.access(SHM_DIR, os.W_OK):
+        root = Path(tempfile.mkdtemp(prefix="plumberlama_sites_", dir=SHM_DIR))
+        yield root
+        shutil.rmtree(root, ignore_errors=True)
+    else:
+        yield tmp_path_factory.mktemp("sites")
+
+
+@pytest.fixture
+def site_tmp_path(site_build_root):
+    """Fresh per-test directory under site_build_root, removed after the test."""
+    path = Path(tempfile.mkdtemp(dir=site_build_root))
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture(scope="module")
+def built_docs(
+    sample_processed_metadata,
+    results_with_counter,
+    module_db_config,
+    db_engine,
+    site_build_root,
+    worker_prefix,
+):
+    """Save the sample survey to the database and build its documentation.
+
+    Shared by all tests of a module that only inspect the built site. The
+    survey tables carry the xdist worker prefix and are dropped at module end.
+
+    Yields:
+        DocumentedState of the built site
+    """
+    survey_id = f"{worker_prefix}_hosting_survey"
+    module_db_config.survey_id = survey_id
+
+    save_to_database(
+        results_df=results_with_counter,
+        metadata_df=sample_processed_metadata.final_metadata_df,
+        table_prefix=survey_id,
+        append=False,
+        config=module_db_config,
+    )
+
+    # Simulate docker volume structure (site is served from app/docs)
+    app_dir = Path(tempfile.mkdtemp(prefix="app_", dir=site_build_root))
+    module_db_config.site_output_dir = str(app_dir / "docs")
+
+    yield generate_doc(module_db_config)
+
+    shutil.rmtree(app_dir, ignore_errors=True)
+    with db_engine.begin() as conn:
+        conn.execute(
+            text(
+                f"DROP TABLE IF EXISTS {survey_id}_results, {survey_id}_metadata CASCADE"
+            )
+        )
@@ -1,22 +1,24 @@
 import polars as pl
-from sqlalchemy import inspect, text
+from sqlalchemy import text
 
 from plumberlama.io.database import query_database, save_to_database
 
 
 def test_database_connection(db_connection):
     """Test that database connection is working."""
-    with db_connection.connect() as conn:
-        result = conn.execute(text("SELECT version()"))
-        version = result.fetchone()[0]
-        assert "PostgreSQL" in version
+    result = db_connection.execute(text("SELECT version()"))
+    version = result.fetchone()[0]
+    assert "PostgreSQL" in version
 
 
 def test_save_to_database_basic(
-    sample_processed_results, sample_processed_metadata, test_db_config, db_connection
+    sample_processed_results,
+    sample_processed_metadata,
+    db_connection,
+    worker_prefix,
 ):
     """Test basic save_to_database functionality with sample data."""
-    table_prefix = "test_basic_save"
+    table_prefix = f"{worker_prefix}_basic_save"
 
     # Save to database
     save_to_database(
@@ -24,21 +26,30 @@ def test_save_to_database_basic(
         metadata_df=sample_processed_metadata.final_metadata_df,
         table_prefix=table_prefix,
         append=False,
-        config=test_db_config,
+        connection=db_connection,
     )
 
     # Verify tables were created
-    inspector = inspect(db_connection)
-    tables = inspector.get_table_names()
-    assert f"{table_prefix}_results" in tables
-    assert f"{table_prefix}_metadata" in tables
+    results_table, metadata_table = db_connection.execute(
+        text("SELECT to_regclass(:results), to_regclass(:metadata)"),
+        {
+            "results": f"{table_prefix}_results",
+            "metadata": f"{table_prefix}_metadata",
+        },
+    ).one()
+    assert results_table is not None
+    assert metadata_table is not None
 
 
 def test_load_results_from_database(
-    sample_processed_results, sample_processed_metadata, test_db_config, db_connection
+    sample_processed_results,
+    sample_processed_metadata,
+    test_db_config,
+    db_connection,
+    worker_prefix,
 ):
     """Test loading survey results from database."""
-    table_prefix = "test_load_results"
+    table_prefix = f"{worker_prefix}_load_results"
 
     # Save to database
     save_to_database(
@@ -65,10 +76,14 @@ def test_load_results_from_database(
 
 
 def test_load_metadata_from_database(
-    sample_processed_metadata, sample_processed_results, test_db_config, db_connection
+    sample_processed_metadata,
+    sample_processed_results,
+    test_db_config,
+    db_connection,
+    worker_prefix,
 ):
     """Test loading metadata from database."""
-    table_prefix = "test_load_metadata"
+    table_prefix = f"{worker_prefix}_load_metadata"
 
     # Save to database
     save_to_database(
@@ -95,10 +110,14 @@ def test_load_metadata_from_database(
 
 
 def test_database_create_behavior(
-    sample_processed_results, sample_processed_metadata, test_db_config, db_connection
+    sample_processed_results,
+    sample_processed_metadata,
+    test_db_config,
+    db_connection,
+    worker_prefix,
 ):
     """Test that creating new tables with append=False works correctly."""
-    table_prefix = "test_create"
+    table_prefix = f"{worker_prefix}_create"
 
     # Create new tables
     save_to_database(
@@ -122,10 +141,14 @@ def test_database_create_behavior(
 
 
 def test_database_append_behavior(
-    sample_processed_results, sample_processed_metadata, test_db_config, db_connection
+    sample_processed_results,
+    sample_processed_metadata,
+    test_db_config,
+    db_connection,
+    worker_prefix,
 ):
     """Test that if_exists='append' correctly adds to existing tables."""
-    table_prefix = "test_append"
+    table_prefix = f"{worker_prefix}_append"
 
     # Save original data
     save_to_database(
@@ -155,10 +178,14 @@ def test_database_append_behavior(
 
 
 def test_query_with_filter(
-    sample_processed_results, sample_processed_metadata, test_db_config, db_connection
+    sample_processed_results,
+    sample_processed_metadata,
+    test_db_config,
+    db_connection,
+    worker_prefix,
 ):
     """Test querying database with WHERE clause."""
-    table_prefix = "test_query_filter"
+    table_prefix = f"{worker_prefix}_query_filter"
 
     # Save to database
     save_to_database(
@@ -181,10 +208,14 @@ def test_query_with_filter(
 
 
 def test_data_types_preserved(
-    sample_processed_results, sample_processed_metadata, test_db_config, db_connection
+    sample_processed_results,
+    sample_processed_metadata,
+    test_db_config,
+    db_connection,
+    worker_prefix,
 ):
     """Test that data types are preserved when saving and loading from database."""
-    table_prefix = "test_data_types"
+    table_prefix = f"{worker_prefix}_data_types"
 
     # Save to database
     save_to_database(
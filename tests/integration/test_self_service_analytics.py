@@ -13,10 +13,14 @@ from plumberlama.io.database import query_database, save_to_database
 
 
 def test_self_service_get_question_metadata(
-    sample_processed_results, sample_processed_metadata, test_db_config, db_connection
+    sample_processed_results,
+    sample_processed_metadata,
+    test_db_config,
+    db_connection,
+    worker_prefix,
 ):
     """Test retrieving metadata for a specific question - typical self-service query."""
-    table_prefix = "test_self_service_meta"
+    table_prefix = f"{worker_prefix}_self_service_meta"
 
     # Save to database
     save_to_database(
@@ -40,15 +44,14 @@ def test_self_service_get_question_metadata(
 
 
 def test_self_service_frequency_analysis(
-    sample_processed_results, sample_processed_metadata, test_db_config, db_connection
+    results_with_counter,
+    sample_processed_metadata,
+    test_db_config,
+    db_connection,
+    worker_prefix,
 ):
     """Test frequency analysis with labels - typical self-service analytics."""
-    table_prefix = "test_self_service_freq"
-
-    # Save to database with load_counter
-    results_with_counter = sample_processed_results.results_df.with_columns(
-        pl.lit(0).alias("load_counter")
-    )
+    table_prefix = f"{worker_prefix}_self_service_freq"
 
     save_to_database(
         results_df=results_with_counter,
@@ -64,38 +67,48 @@ def test_self_service_frequency_analysis(
         database_queries.find_variable_by_question_type(table_prefix, "single_choice"),
         config=test_db_config,
     )
+    assert len(metadata) > 0
+    var_name = metadata["id"][0]
 
-    if len(metadata) > 0:
-        var_name = metadata["id"][0]
-
-        # Frequency analysis query
-        query = database_queries.get_frequency_distribution(table_prefix, var_name)
-        freq_results = query_database(query, config=test_db_config)
+    # Frequency analysis query
+    query = database_queries.get_frequency_distribution(table_prefix, var_name)
+    freq_results = query_database(query, config=test_db_config)
 
-        assert isinstance(freq_results, pl.DataFrame)
-        assert "count" in freq_results.columns
-        assert "percentage" in freq_results.columns
+    assert isinstance(freq_results, pl.DataFrame)
+    assert len(freq_results) > 0
+    assert "count" in freq_results.columns
+    assert "percentage" in freq_results.columns
 
 
 def test_self_service_time_series_analysis(
-    sample_processed_results, sample_processed_metadata, test_db_config, db_connection
+    sample_processed_results,
+    sample_processed_metadata,
+    test_db_config,
+    db_connection,
+    worker_prefix,
 ):
     """Test analyzing data across multiple waves using load_counter."""
-    table_prefix = "test_self_service_timeseries"
-
-    # Simulate three waves of data collection
-    for wave in range(3):
-        results_with_counter = sample_processed_results.results_df.with_columns(
-            pl.lit(wave).alias("load_counter")
-        )
+    table_prefix = f"{worker_prefix}_self_service_timeseries"
+
+    # Simulate three waves of data collection, written in a single load
+    waves = pl.concat(
+        [
+            sample_processed_results.results_df.with_columns(
+                pl.lit(wave, dtype=pl.Int32).alias("load_counter")
+            )
+            for wave in range(3)
+        ],
+        how="vertical",
+        rechunk=True,
+    )
 
-        save_to_database(
-            results_df=results_with_counter,
-            metadata_df=sample_processed_metadata.final_metadata_df,
-            table_prefix=table_prefix,
-            append=(wave > 0),
-            config=test_db_config,
-        )
+    save_to_database(
+        results_df=waves,
+        metadata_df=sample_processed_metadata.final_metadata_df,
+        table_prefix=table_prefix,
+        append=False,
+        config=test_db_config,
+    )
 
     # Self-service query: Analyze trends across waves
     # Get a scale variable
@@ -103,29 +116,28 @@ def test_self_service_time_series_analysis(
         database_queries.find_variable_by_question_type(table_prefix, "scale"),
         config=test_db_config,
     )
+    assert len(metadata) > 0
+    var_name = metadata["id"][0]
 
-    if len(metadata) > 0:
-        var_name = metadata["id"][0]
-
-        query = database_queries.get_time_series_analysis(table_prefix, var_name)
-        timeseries = query_database(query, config=test_db_config)
+    query = database_queries.get_time_series_analysis(table_prefix, var_name)
+    timeseries = query_database(query, config=test_db_config)
 
-        assert isinstance(timeseries, pl.DataFrame)
-        assert len(timeseries) == 3  # Three waves
-        assert "wave" in timeseries.columns
-        assert "avg_value" in timeseries.columns
-        assert "response_count" in timeseries.columns
+    assert isinstance(timeseries, pl.DataFrame)
+    assert len(timeseries) == 3  # Three waves
+    assert "wave" in timeseries.columns
+    assert "avg_value" in timeseries.columns
+    assert "response_count" in timeseries.columns
 
 
 def test_self_service_matrix_question_analysis(
-    sample_processed_results, sample_processed_metadata, test_db_config, db_connection
+    results_with_counter,
+    sample_processed_metadata,
+    test_db_config,
+    db_connection,
+    worker_prefix,
 ):
     """Test analyzing matrix questions with scale labels for visualization."""
-    table_prefix = "test_self_service_matrix"
-
-    results_with_counter = sample_processed_results.results_df.with_columns(
-        pl.lit(0).alias("load_counter")
-    )
+    table_prefix = f"{worker_prefix}_self_service_matrix"
 
     save_to_database(
         results_df=results_with_counter,
@@ -11,9 +11,10 @@ def test_single_variable_renamed_simply(single_variable_subset, llm_and_generato
     llm, generator = llm_and_generator
 
     updated_metadata_df = rename_vars_with_labels(metadata_df, generator, llm)
+    var_ids = updated_metadata_df["id"].to_list()
 
-    assert "Q1" in updated_metadata_df["id"].to_list()
-    assert "V1" not in updated_metadata_df["id"].to_list()
+    assert "Q1" in var_ids
+    assert "V1" not in var_ids
     assert "original_id" in updated_metadata_df.columns
     assert "V1" in updated_metadata_df["original_id"].to_list()
     # Check mapping via original_id column
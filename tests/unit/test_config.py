@@ -0,0 +1,64 @@
+"""Tests for Config."""
+
+import pytest
+
+from plumberlama.config import Config
+
+
+@pytest.fixture
+def base_config():
+    """Config with placeholder values (no environment needed)."""
+    return Config(
+        survey_id="survey",
+        lp_poll_id=1,
+        lp_api_token="token",
+        lp_api_base_url="https://example.org/api",
+        llm_model="model",
+        llm_key="key",
+        llm_base_url="https://example.org/llm",
+        site_output_dir="/tmp/site",
+        mkdocs_site_name="",
+        mkdocs_site_author="",
+        mkdocs_repo_url="",
+        mkdocs_logo_url="",
+        db_host="localhost",
+        db_port=5432,
+        db_name="survey_data",
+        db_user="user",
+        db_password="password",
+    )
+
+
+def test_replace_returns_updated_copy(base_config):
+    """Test that replace overrides only the given attributes on a new Config."""
+    replaced = base_config.replace(survey_id="other", db_port=5433)
+
+    assert isinstance(replaced, Config)
+    assert replaced is not base_config
+    assert replaced.survey_id == "other"
+    assert replaced.db_port == 5433
+    assert replaced.db_host == base_config.db_host
+    assert replaced.mkdocs_site_name == base_config.mkdocs_site_name
+
+    # Original is untouched
+    assert base_config.survey_id == "survey"
+    assert base_config.db_port == 5432
+
+
+def test_replace_rejects_unknown_attribute(base_config):
+    """Test that replace fails on attributes Config does not have."""
+    with pytest.raises(TypeError, match="doc_output_dir"):
+        base_config.replace(doc_output_dir="/tmp/docs")
+
+
+def test_replace_validates_new_values(base_config):
+    """Test that replace runs the same validation as the constructor."""
+    with pytest.raises(AssertionError, match="poll_id must be positive"):
+        base_config.replace(lp_poll_id=0)
+
+
+def test_replace_recomputes_cleared_defaults(base_config):
+    """Test that a cleared derived default is recomputed from the new values."""
+    replaced = base_config.replace(survey_id="other", mkdocs_site_name="")
+
+    assert replaced.mkdocs_site_name == "other Survey Documentation"
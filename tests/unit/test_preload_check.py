@@ -1,91 +1,85 @@
-import polars as pl
 import pytest
-from polars.testing import assert_frame_equal
+from polars.testing import assert_series_equal
 
+from tests.helpers import with_first_value
 
-def test_frame_equal_with_identical_metadata(sample_processed_metadata):
+PRELOAD_COLUMNS = ["original_id", "id", "question_type"]
+
+
+def _project(df):
+    """Sort metadata by original_id and keep the columns compared in these tests."""
+    return df.sort("original_id").select(PRELOAD_COLUMNS)
+
+
+@pytest.fixture(scope="module")
+def sorted_metadata_projection(sample_processed_metadata):
+    """Sorted projection of the sample metadata, shared by the module."""
+    return _project(sample_processed_metadata.final_metadata_df)
+
+
+def test_frame_equal_with_identical_metadata(
+    sample_processed_metadata, sorted_metadata_projection
+):
     """Test that identical metadata passes assert_frame_equal."""
-    df1 = sample_processed_metadata.final_metadata_df.sort("original_id").select(
-        ["original_id", "id", "question_type"]
-    )
-    df2 = sample_processed_metadata.final_metadata_df.sort("original_id").select(
-        ["original_id", "id", "question_type"]
-    )
+    df1 = sorted_metadata_projection
+    df2 = _project(sample_processed_metadata.final_metadata_df)
 
-    # Should not raise
-    assert_frame_equal(df1, df2, check_row_order=True, check_column_order=False)
+    # Should not raise (frames are pre-sorted, so compare column by column)
+    for col in PRELOAD_COLUMNS:
+        assert_series_equal(df1[col], df2[col])
 
 
-def test_frame_equal_fails_on_different_variable_count(sample_processed_metadata):
+def test_frame_equal_fails_on_different_variable_count(
+    sample_processed_metadata, sorted_metadata_projection
+):
     """Test that validation fails when number of variables differs."""
-    df1 = sample_processed_metadata.final_metadata_df.sort("original_id").select(
-        ["original_id", "id", "question_type"]
-    )
-    df2 = (
-        sample_processed_metadata.final_metadata_df.head(5)
-        .sort("original_id")
-        .select(["original_id", "id", "question_type"])
-    )
+    df1 = sorted_metadata_projection
+    df2 = _project(sample_processed_metadata.final_metadata_df.head(5))
 
     with pytest.raises(AssertionError):
-        assert_frame_equal(df1, df2, check_row_order=True, check_column_order=False)
+        assert_series_equal(df1["original_id"], df2["original_id"])
 
 
-def test_frame_equal_fails_on_different_variable_ids(sample_processed_metadata):
+def test_frame_equal_fails_on_different_variable_ids(
+    sorted_metadata_projection, sample_processed_metadata
+):
     """Test that validation fails when variable IDs differ."""
-    modified_df = sample_processed_metadata.final_metadata_df.clone()
-    modified_df = modified_df.with_columns(
-        pl.when(pl.col("original_id") == modified_df["original_id"][0])
-        .then(pl.lit("CHANGED_ID"))
-        .otherwise(pl.col("original_id"))
-        .alias("original_id")
+    modified_df = with_first_value(
+        sample_processed_metadata.final_metadata_df, "original_id", "CHANGED_ID"
     )
 
-    df1 = sample_processed_metadata.final_metadata_df.sort("original_id").select(
-        ["original_id", "id", "question_type"]
-    )
-    df2 = modified_df.sort("original_id").select(["original_id", "id", "question_type"])
+    df1 = sorted_metadata_projection
+    df2 = _project(modified_df)
 
     with pytest.raises(AssertionError):
-        assert_frame_equal(df1, df2, check_row_order=True, check_column_order=False)
+        assert_series_equal(df1["original_id"], df2["original_id"])
 
 
-def test_frame_equal_fails_on_different_renamed_ids(sample_processed_metadata):
+def test_frame_equal_fails_on_different_renamed_ids(
+    sorted_metadata_projection, sample_processed_metadata
+):
     """Test that validation fails when renamed variable IDs differ."""
-    modified_df = sample_processed_metadata.final_metadata_df.clone()
-    first_id = modified_df["id"][0]
-
-    modified_df = modified_df.with_columns(
-        pl.when(pl.col("id") == first_id)
-        .then(pl.lit("CHANGED_RENAMED_ID"))
-        .otherwise(pl.col("id"))
-        .alias("id")
+    modified_df = with_first_value(
+        sample_processed_metadata.final_metadata_df, "id", "CHANGED_RENAMED_ID"
     )
 
-    df1 = sample_processed_metadata.final_metadata_df.sort("original_id").select(
-        ["original_id", "id", "question_type"]
-    )
-    df2 = modified_df.sort("original_id").select(["original_id", "id", "question_type"])
+    df1 = sorted_metadata_projection
+    df2 = _project(modified_df)
 
     with pytest.raises(AssertionError):
-        assert_frame_equal(df1, df2, check_row_order=True, check_column_order=False)
+        assert_series_equal(df1["id"], df2["id"])
 
 
-def test_frame_equal_fails_on_different_question_types(sample_processed_metadata):
+def test_frame_equal_fails_on_different_question_types(
+    sorted_metadata_projection, sample_processed_metadata
+):
     """Test that validation fails when question types differ."""
-    modified_df = sample_processed_metadata.final_metadata_df.clone()
-
-    modified_df = modified_df.with_columns(
-        pl.when(pl.col("question_type") == "single_choice")
-        .then(pl.lit("multiple_choice"))
-        .otherwise(pl.col("question_type"))
-        .alias("question_type")
+    modified_df = with_first_value(
+        sample_processed_metadata.final_metadata_df, "question_type", "CHANGED_TYPE"
     )
 
-    df1 = sample_processed_metadata.final_metadata_df.sort("original_id").select(
-        ["original_id", "id", "question_type"]
-    )
-    df2 = modified_df.sort("original_id").select(["original_id", "id", "question_type"])
+    df1 = sorted_metadata_projection
+    df2 = _project(modified_df)
 
     with pytest.raises(AssertionError):
-        assert_frame_equal(df1, df2, check_row_order=True, check_column_order=False)
+        assert_series_equal(df1["question_type"], df2["question_type"])
@@ -6,234 +6,225 @@ from plumberlama.generated_api_models import Questions
 from plumberlama.parse_metadata import parse_question
 
 
-@pytest.fixture
-def multiple_choice_other_question():
-    """Question with 'other' option (V40, V41, V42 choices + V42.1 text field)"""
+def _group(group_id, varnames, **overrides):
+    """Question group dict with empty name/labels/codes/items unless overridden."""
     return {
-        "id": 27937521,
-        "pollId": 123,
-        "type": "CHOICE",
-        "question": {"de": "Warum engagierst du dich bei [U25]?"},
-        "position": 8,
-        "pageId": 1,
-        "groups": [
-            {
-                "id": 0,
-                "name": {},
-                "varnames": ["V40", "V41", "V42"],
-                "labels": [{"de": "Reason 1"}, {"de": "Reason 2"}, {"de": "Anderes"}],
-                "codes": [],
-                "items": [],
-            },
-            {
-                "id": 1,
-                "name": {},
-                "varnames": ["V42.1"],
-                "labels": [],
-                "codes": [],
-                "inputType": "SINGLELINE",
-                "items": [{"id": "1", "name": {"de": "Other text"}}],
-            },
-        ],
+        "id": group_id,
+        "name": {},
+        "varnames": varnames,
+        "labels": [],
+        "codes": [],
+        "items": [],
+        **overrides,
     }
 
 
-@pytest.fixture
-def multiple_choice_other_empty_label_question():
-    """Question with empty label for 'other' boolean"""
-    return {
-        "id": 27937575,
-        "pollId": 123,
-        "type": "CHOICE",
-        "question": {"de": "Test question"},
-        "position": 16,
-        "pageId": 1,
-        "groups": [
-            {
-                "id": 0,
-                "name": {},
-                "varnames": ["V69", "V70"],
-                "labels": [{"de": "Choice 1"}, {}],
-                "codes": [],
-                "items": [],
-            },
-            {
-                "id": 1,
-                "name": {},
-                "varnames": ["V70.1"],
-                "labels": [],
-                "codes": [],
-                "inputType": "SINGLELINE",
-                "items": [{"id": "1", "name": {"de": "Other text"}}],
-            },
-        ],
-    }
-
-
-@pytest.fixture
-def matrix_question():
-    """Matrix question with item labels"""
-    return {
-        "id": 27937509,
-        "pollId": 123,
-        "type": "MATRIX",
-        "question": {"de": "Matrix question"},
-        "position": 4,
-        "pageId": 1,
-        "groups": [
-            {
-                "id": 0,
-                "name": {},
-                "varnames": ["V10", "V11", "V12"],
-                "labels": [{"de": "Option A"}, {"de": "Option B"}],
-                "codes": [],
-                "items": [
-                    {"id": "1", "name": {"de": "Item 1"}},
-                    {"id": "2", "name": {"de": "Item 2"}},
-                    {"id": "3", "name": {"de": "Item 3"}},
-                ],
-                "range": [1, 2, 1],
-            }
-        ],
-    }
-
-
-@pytest.fixture
-def input_multiple_question():
-    """Multiple input question with group names"""
-    return {
-        "id": 27937500,
-        "pollId": 123,
-        "type": "INPUT",
-        "question": {"de": "Multiple inputs"},
-        "position": 1,
-        "pageId": 1,
-        "groups": [
-            {
-                "id": 0,
-                "varnames": ["V1"],
-                "name": {"de": "First field"},
-                "labels": [],
-                "codes": [],
-                "inputType": "SINGLELINE",
-                "items": [{"id": "1"}],
-            },
-            {
-                "id": 1,
-                "varnames": ["V2"],
-                "name": {"de": "Second field"},
-                "labels": [],
-                "codes": [],
-                "inputType": "SINGLELINE",
-                "items": [{"id": "2"}],
-            },
-        ],
-    }
-
+def _q(question_id, question_type, text, position, groups):
+    """Questions model with the poll/page boilerplate filled in."""
+    return Questions(
+        id=question_id,
+        pollId=123,
+        type=question_type,
+        question={"de": text},
+        position=position,
+        pageId=1,
+        groups=groups,
+    )
 
-@pytest.fixture
-def single_choice_question():
-    """Single choice question with possible values"""
-    return {
-        "id": 27937503,
-        "pollId": 123,
-        "type": "CHOICE",
-        "question": {"de": "Single choice"},
-        "position": 2,
-        "pageId": 1,
-        "groups": [
-            {
-                "id": 0,
-                "name": {},
-                "varnames": ["V3"],
-                "labels": [{"de": "Option A"}, {"de": "Option B"}, {"de": "Option C"}],
-                "codes": ["1", "2", "3"],
-                "items": [{"id": "1"}],
-            }
-        ],
-    }
 
+OTHER_TEXT_ITEMS = [{"id": "1", "name": {"de": "Other text"}}]
+
+
+# Question with 'other' option (V40, V41, V42 choices + V42.1 text field)
+MULTIPLE_CHOICE_OTHER_Q = _q(
+    27937521,
+    "CHOICE",
+    "Warum engagierst du dich bei [U25]?",
+    8,
+    [
+        _group(
+            0,
+            ["V40", "V41", "V42"],
+            labels=[{"de": "Reason 1"}, {"de": "Reason 2"}, {"de": "Anderes"}],
+        ),
+        _group(1, ["V42.1"], inputType="SINGLELINE", items=OTHER_TEXT_ITEMS),
+    ],
+)
+
+
+# Question with empty label for 'other' boolean
+MULTIPLE_CHOICE_OTHER_EMPTY_LABEL_Q = _q(
+    27937575,
+    "CHOICE",
+    "Test question",
+    16,
+    [
+        _group(0, ["V69", "V70"], labels=[{"de": "Choice 1"}, {}]),
+        _group(1, ["V70.1"], inputType="SINGLELINE", items=OTHER_TEXT_ITEMS),
+    ],
+)
+
+
+# Matrix question with item labels
+MATRIX_Q = _q(
+    27937509,
+    "MATRIX",
+    "Matrix question",
+    4,
+    [
+        _group(
+            0,
+            ["V10", "V11", "V12"],
+            labels=[{"de": "Option A"}, {"de": "Option B"}],
+            items=[
+                {"id": "1", "name": {"de": "Item 1"}},
+                {"id": "2", "name": {"de": "Item 2"}},
+                {"id": "3", "name": {"de": "Item 3"}},
+            ],
+            range=[1, 2, 1],
+        )
+    ],
+)
+
+
+# Multiple input question with group names
+INPUT_MULTIPLE_Q = _q(
+    27937500,
+    "INPUT",
+    "Multiple inputs",
+    1,
+    [
+        _group(
+            0,
+            ["V1"],
+            name={"de": "First field"},
+            inputType="SINGLELINE",
+            items=[{"id": "1"}],
+        ),
+        _group(
+            1,
+            ["V2"],
+            name={"de": "Second field"},
+            inputType="SINGLELINE",
+            items=[{"id": "2"}],
+        ),
+    ],
+)
+
+
+# Single choice question with possible values
+SINGLE_CHOICE_Q = _q(
+    27937503,
+    "CHOICE",
+    "Single choice",
+    2,
+    [
+        _group(
+            0,
+            ["V3"],
+            labels=[{"de": "Option A"}, {"de": "Option B"}, {"de": "Option C"}],
+            codes=["1", "2", "3"],
+            items=[{"id": "1"}],
+        )
+    ],
+)
+
+
+# Scale question with range
+SCALE_Q = _q(
+    27937506,
+    "SCALE",
+    "Rate this",
+    5,
+    [_group(0, ["V15"], range=[1, 5, 1])],
+)
+
+
+@pytest.mark.parametrize(
+    "question, position, expected_type, expected_var_count",
+    [
+        pytest.param(
+            MULTIPLE_CHOICE_OTHER_Q,
+            8,
+            "multiple_choice_other",
+            4,
+            id="multiple_choice_other_question",
+        ),
+        pytest.param(
+            MULTIPLE_CHOICE_OTHER_EMPTY_LABEL_Q,
+            16,
+            "multiple_choice_other",
+            3,
+            id="multiple_choice_other_empty_label_question",
+        ),
+        pytest.param(MATRIX_Q, 4, "matrix", 3, id="matrix_question"),
+        pytest.param(
+            INPUT_MULTIPLE_Q,
+            1,
+            "input_multiple_singleline",
+            2,
+            id="input_multiple_question",
+        ),
+        pytest.param(
+            SINGLE_CHOICE_Q, 1, "single_choice", 1, id="single_choice_question"
+        ),
+        pytest.param(SCALE_Q, 1, "scale", 1, id="scale_question"),
+    ],
+)
+def test_question_type_and_variable_count(
+    question, position, expected_type, expected_var_count
+):
+    """Test question type detection and variable count for each question kind."""
+    question_dict, variables = parse_question(
+        question, absolute_position=position, page_number=1
+    )
 
-@pytest.fixture
-def scale_question():
-    """Scale question with range"""
-    return {
-        "id": 27937506,
-        "pollId": 123,
-        "type": "SCALE",
-        "question": {"de": "Rate this"},
-        "position": 5,
-        "pageId": 1,
-        "groups": [
-            {
-                "id": 0,
-                "name": {},
-                "varnames": ["V15"],
-                "labels": [],
-                "codes": [],
-                "range": [1, 5, 1],
-                "items": [],
-            }
-        ],
-    }
+    assert question_dict["question_type"] == expected_type
+    assert len(variables) == expected_var_count
 
 
-def test_multiple_choice_other_no_duplicate_boolean(multiple_choice_other_question):
+def test_multiple_choice_other_no_duplicate_boolean():
     """Test that multiple_choice_other doesn't create duplicate 'other' boolean variable."""
-    question = Questions(**multiple_choice_other_question)
-    question_dict, variables = parse_question(
-        question, absolute_position=8, page_number=1
+    _, variables = parse_question(
+        MULTIPLE_CHOICE_OTHER_Q, absolute_position=8, page_number=1
     )
 
-    assert question_dict["question_type"] == "multiple_choice_other"
-    assert len(variables) == 4
+    by_id = {v["id"]: v for v in variables}
 
-    # Check for V42 (other boolean) - should appear exactly once
-    v42_vars = [v for v in variables if v["id"] == "V42"]
-    assert (
-        len(v42_vars) == 1
-    ), f"V42 should appear exactly once, found {len(v42_vars)} times"
-    assert v42_vars[0]["is_other_boolean"]
-    assert v42_vars[0]["schema_variable_type"] == "Boolean"
-    assert v42_vars[0]["label"] == "Anderes"
+    # Check for V42 (other boolean) - every id, V42 included, appears exactly once
+    assert len(by_id) == len(
+        variables
+    ), f"Duplicate variable ids: {[v['id'] for v in variables]}"
+    assert by_id["V42"]["is_other_boolean"]
+    assert by_id["V42"]["schema_variable_type"] == "Boolean"
+    assert by_id["V42"]["label"] == "Anderes"
 
     # Check for V42.1 (other text field)
-    v42_1_vars = [v for v in variables if v["id"] == "V42.1"]
-    assert len(v42_1_vars) == 1
-    assert v42_1_vars[0]["is_other_text"]
-    assert v42_1_vars[0]["schema_variable_type"] == "String"
+    assert by_id["V42.1"]["is_other_text"]
+    assert by_id["V42.1"]["schema_variable_type"] == "String"
 
     # Check regular choice variables have is_other_boolean=False
-    v40 = [v for v in variables if v["id"] == "V40"][0]
-    assert not v40["is_other_boolean"]
+    assert not by_id["V40"]["is_other_boolean"]
 
 
-def test_multiple_choice_other_empty_label(multiple_choice_other_empty_label_question):
+def test_multiple_choice_other_empty_label():
     """Test multiple_choice_other with empty label for 'other' boolean."""
-    question = Questions(**multiple_choice_other_empty_label_question)
-    question_dict, variables = parse_question(
-        question, absolute_position=16, page_number=1
+    _, variables = parse_question(
+        MULTIPLE_CHOICE_OTHER_EMPTY_LABEL_Q, absolute_position=16, page_number=1
     )
 
-    assert question_dict["question_type"] == "multiple_choice_other"
-    assert len(variables) == 3
+    by_id = {v["id"]: v for v in variables}
 
     # V70 should appear once with empty label
-    v70_vars = [v for v in variables if v["id"] == "V70"]
-    assert len(v70_vars) == 1
-    assert v70_vars[0]["is_other_boolean"]
-    assert v70_vars[0]["label"] == ""
+    assert len(by_id) == len(variables)
+    assert by_id["V70"]["is_other_boolean"]
+    assert by_id["V70"]["label"] == ""
 
 
-def test_matrix_with_items(matrix_question):
+def test_matrix_with_items():
     """Test matrix question with item labels."""
-    question = Questions(**matrix_question)
-    question_dict, variables = parse_question(
-        question, absolute_position=4, page_number=1
-    )
+    _, variables = parse_question(MATRIX_Q, absolute_position=4, page_number=1)
 
-    assert question_dict["question_type"] == "matrix"
-    assert len(variables) == 3
     assert variables[0]["label"] == "Item 1"
     assert variables[1]["label"] == "Item 2"
     assert variables[2]["label"] == "Item 3"
@@ -246,30 +237,20 @@ def test_matrix_with_items(matrix_question):
         assert var["range_max"] == 2
 
 
-def test_input_multiple_with_group_names(input_multiple_question):
+def test_input_multiple_with_group_names():
     """Test input_multiple gets labels from group names."""
-    question = Questions(**input_multiple_question)
-    question_dict, variables = parse_question(
-        question, absolute_position=1, page_number=1
-    )
+    _, variables = parse_question(INPUT_MULTIPLE_Q, absolute_position=1, page_number=1)
 
-    assert question_dict["question_type"] == "input_multiple_singleline"
-    assert len(variables) == 2
     assert variables[0]["label"] == "First field"
     assert variables[1]["label"] == "Second field"
     assert variables[0]["schema_variable_type"] == "String"
     assert variables[1]["schema_variable_type"] == "String"
 
 
-def test_single_choice_with_possible_values(single_choice_question):
+def test_single_choice_with_possible_values():
     """Test single_choice creates possible_values mapping."""
-    question = Questions(**single_choice_question)
-    question_dict, variables = parse_question(
-        question, absolute_position=1, page_number=1
-    )
+    _, variables = parse_question(SINGLE_CHOICE_Q, absolute_position=1, page_number=1)
 
-    assert question_dict["question_type"] == "single_choice"
-    assert len(variables) == 1
     assert variables[0]["possible_values_codes"] == ["1", "2", "3"]
     assert variables[0]["possible_values_labels"] == [
         "Option A",
@@ -279,15 +260,10 @@ def test_single_choice_with_possible_values(single_choice_question):
     assert variables[0]["schema_variable_type"] == "String"
 
 
-def test_scale_with_range(scale_question):
+def test_scale_with_range():
     """Test scale question extracts range correctly."""
-    question = Questions(**scale_question)
-    question_dict, variables = parse_question(
-        question, absolute_position=1, page_number=1
-    )
+    _, variables = parse_question(SCALE_Q, absolute_position=1, page_number=1)
 
-    assert question_dict["question_type"] == "scale"
-    assert len(variables) == 1
     assert variables[0]["range_min"] == 1
     assert variables[0]["range_max"] == 5
     assert variables[0]["schema_variable_type"] == "Int64"
@@ -4,12 +4,9 @@ from plumberlama.states import FetchedResultsState
 from plumberlama.transitions import process_poll_results
 
 
-def test_process_poll_results(sample_processed_metadata, sample_loaded_results):
+def test_process_poll_results(sample_processed_results):
     """Test processing poll results through the full pipeline."""
-    loaded_results = sample_loaded_results
-
-    result = process_poll_results(sample_processed_metadata, loaded_results)
-    results_df = result.results_df
+    results_df = sample_processed_results.results_df
 
     # Basic assertions
     assert results_df is not None
@@ -54,7 +51,9 @@ def test_process_poll_results_with_empty_enum_values(sample_processed_metadata):
         "V15": ["8", "9", "7"],
     }
 
-    raw_results_df = pl.DataFrame(mock_results)
+    raw_results_df = pl.DataFrame(
+        mock_results, schema={col: pl.String for col in mock_results}
+    )
     fetched_results = FetchedResultsState(raw_results_df=raw_results_df)
 
     # This should not raise an error
@@ -11,26 +11,36 @@ from plumberlama.type_mapping import (
     string_to_polars,
 )
 
+SCALAR_TYPE_NAMES = [
+    (pl.Int64, "Int64"),
+    (pl.Int32, "Int32"),
+    (pl.Float64, "Float64"),
+    (pl.Float32, "Float32"),
+    (pl.String, "String"),
+    (pl.Boolean, "Boolean"),
+    (pl.Date, "Date"),
+    (pl.Datetime, "Datetime"),
+]
+
+LIST_TYPE_NAMES = [
+    (pl.List(pl.String), "List(String)"),
+    (pl.List(pl.Int64), "List(Int64)"),
+    (pl.List(pl.Float64), "List(Float64)"),
+]
+
 
 class TestPolarsToString:
     """Test Polars → String conversion."""
 
-    def test_scalar_types(self):
+    @pytest.mark.parametrize("pl_type, expected", SCALAR_TYPE_NAMES)
+    def test_scalar_types(self, pl_type, expected):
         """Test conversion of scalar types."""
-        assert polars_to_string(pl.Int64) == "Int64"
-        assert polars_to_string(pl.Int32) == "Int32"
-        assert polars_to_string(pl.Float64) == "Float64"
-        assert polars_to_string(pl.Float32) == "Float32"
-        assert polars_to_string(pl.String) == "String"
-        assert polars_to_string(pl.Boolean) == "Boolean"
-        assert polars_to_string(pl.Date) == "Date"
-        assert polars_to_string(pl.Datetime) == "Datetime"
-
-    def test_list_types(self):
+        assert polars_to_string(pl_type) == expected
+
+    @pytest.mark.parametrize("pl_type, expected", LIST_TYPE_NAMES)
+    def test_list_types(self, pl_type, expected):
         """Test conversion of List types."""
-        assert polars_to_string(pl.List(pl.String)) == "List(String)"
-        assert polars_to_string(pl.List(pl.Int64)) == "List(Int64)"
-        assert polars_to_string(pl.List(pl.Float64)) == "List(Float64)"
+        assert polars_to_string(pl_type) == expected
 
     def test_nested_list_types(self):
         """Test conversion of nested List types."""
@@ -40,22 +50,15 @@ class TestPolarsToString:
 class TestStringToPolars:
     """Test String → Polars conversion."""
 
-    def test_scalar_types(self):
+    @pytest.mark.parametrize("expected, type_str", SCALAR_TYPE_NAMES)
+    def test_scalar_types(self, expected, type_str):
         """Test conversion of scalar types."""
-        assert string_to_polars("Int64") == pl.Int64
-        assert string_to_polars("Int32") == pl.Int32
-        assert string_to_polars("Float64") == pl.Float64
-        assert string_to_polars("Float32") == pl.Float32
-        assert string_to_polars("String") == pl.String
-        assert string_to_polars("Boolean") == pl.Boolean
-        assert string_to_polars("Date") == pl.Date
-        assert string_to_polars("Datetime") == pl.Datetime
-
-    def test_list_types(self):
+        assert string_to_polars(type_str) == expected
+
+    @pytest.mark.parametrize("expected, type_str", LIST_TYPE_NAMES)
+    def test_list_types(self, expected, type_str):
         """Test conversion of List types."""
-        assert string_to_polars("List(String)") == pl.List(pl.String)
-        assert string_to_polars("List(Int64)") == pl.List(pl.Int64)
-        assert string_to_polars("List(Float64)") == pl.List(pl.Float64)
+        assert string_to_polars(type_str) == expected
 
     def test_enum_types_fallback_to_string(self):
         """Test that Enum types deserialize to String."""
@@ -71,26 +74,32 @@ class TestStringToPolars:
 class TestPolarsToSQLAlchemy:
     """Test Polars → SQLAlchemy conversion."""
 
-    def test_scalar_types(self):
+    @pytest.mark.parametrize(
+        "pl_type, expected",
+        [
+            (pl.Int64, Integer),
+            (pl.Int32, Integer),
+            (pl.Float64, Float),
+            (pl.Float32, Float),
+            (pl.String, Text),
+            (pl.Boolean, Boolean),
+            (pl.Datetime, DateTime),
+        ],
+    )
+    def test_scalar_types(self, pl_type, expected):
         """Test conversion of scalar types."""
         # polars_to_sqlalchemy returns type classes, not instances
-        assert polars_to_sqlalchemy(pl.Int64) == Integer
-        assert polars_to_sqlalchemy(pl.Int32) == Integer
-        assert polars_to_sqlalchemy(pl.Float64) == Float
-        assert polars_to_sqlalchemy(pl.Float32) == Float
-        assert polars_to_sqlalchemy(pl.String) == Text
-        assert polars_to_sqlalchemy(pl.Boolean) == Boolean
-        assert polars_to_sqlalchemy(pl.Datetime) == DateTime
-
-    def test_list_types_to_array(self):
-        """Test conversion of List types to PostgreSQL ARRAY."""
-        result = polars_to_sqlalchemy(pl.List(pl.String))
-        assert isinstance(result, ARRAY)
-        assert isinstance(result.item_type, type(Text()))
+        assert polars_to_sqlalchemy(pl_type) == expected
 
-        result = polars_to_sqlalchemy(pl.List(pl.Int64))
+    @pytest.mark.parametrize(
+        "pl_type, item_type",
+        [(pl.List(pl.String), Text), (pl.List(pl.Int64), Integer)],
+    )
+    def test_list_types_to_array(self, pl_type, item_type):
+        """Test conversion of List types to PostgreSQL ARRAY."""
+        result = polars_to_sqlalchemy(pl_type)
         assert isinstance(result, ARRAY)
-        assert isinstance(result.item_type, type(Integer()))
+        assert isinstance(result.item_type, item_type)
 
     def test_object_type_to_text(self):
         """Test that Object type converts to Text."""
@@ -100,9 +109,9 @@ class TestPolarsToSQLAlchemy:
 class TestRoundTrip:
     """Test round-trip conversions."""
 
-    def test_polars_string_polars_roundtrip(self):
-        """Test Polars → String → Polars round-trip."""
-        types = [
+    @pytest.mark.parametrize(
+        "original_type",
+        [
             pl.Int64,
             pl.Int32,
             pl.Float64,
@@ -110,9 +119,10 @@ class TestRoundTrip:
             pl.Boolean,
             pl.List(pl.String),
             pl.List(pl.Int64),
-        ]
-
-        for original_type in types:
-            string_repr = polars_to_string(original_type)
-            recovered_type = string_to_polars(string_repr)
-            assert recovered_type == original_type, f"Failed for {original_type}"
+        ],
+    )
+    def test_polars_string_polars_roundtrip(self, original_type):
+        """Test Polars → String → Polars round-trip."""
+        string_repr = polars_to_string(original_type)
+        recovered_type = string_to_polars(string_repr)
+        assert recovered_type == original_type, f"Failed for {original_type}"